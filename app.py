@@ -4,16 +4,91 @@ import sqlite3
 import datetime
 import calendar
 import re
+import os
+import json
+import itertools
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
 import google.generativeai as genai # Correct library for Google's API
 
+# Import the API key from a separate, secure file
+# Ensure a file named 'secret.py' exists in your project with the key defined
+try:
+    from secret import API_KEY
+except ImportError:
+    API_KEY = "" # Fallback if secret.py is not found
+
+# Spending categories offered in the UI and accepted from the LLM, plus a
+# precomputed category -> position lookup used for O(1) validation
+CATEGORIES = ("Food", "Transportation", "Housing", "Entertainment", "Bills", "Other")
+CAT_INDEX = {category: i for i, category in enumerate(CATEGORIES)}
+
 # --- Database functions ---
-# Function to create a connection to the SQLite database
+DB_PATH = 'finance_tracker.db'
+
+# Fixed categorical dtype so filtering and grouping by category work on integer codes
+CATEGORY_DTYPE = pd.CategoricalDtype(categories=CATEGORIES)
+
+# Function to create the (single) write connection to the SQLite database
+# Cached as a resource so a single connection is reused across reruns instead of
+# reopening the file for every query. isolation_level=None puts it in autocommit mode.
+@st.cache_resource
 def get_db_connection():
-    conn = sqlite3.connect('finance_tracker.db')
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
     conn.row_factory = sqlite3.Row  # This allows accessing columns by name
+    # Tune the connection once: WAL lets readers and the writer proceed concurrently,
+    # and synchronous=NORMAL avoids a full fsync on every commit
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA busy_timeout=5000')
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA temp_store=MEMORY')
     return conn
 
+# Lock serializing writes on the shared write connection across sessions
+@st.cache_resource
+def get_write_lock():
+    return threading.Lock()
+
+# Function to create a pool of read-only connections, handed out round-robin
+# Reads never wait on the writer's lock since WAL lets them see the last committed state
+@st.cache_resource
+def get_read_pool():
+    readers = []
+    for _ in range(os.cpu_count() or 1):
+        conn = sqlite3.connect(f'file:{DB_PATH}?mode=ro', uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA cache_size=-20000')
+        readers.append(conn)
+    return itertools.cycle(readers)
+
+# Function to get the next read-only connection from the pool
+def get_read_connection():
+    return next(get_read_pool())
+
+# Context manager wrapping writes in a single BEGIN IMMEDIATE transaction
+# BEGIN IMMEDIATE takes the write lock up front instead of failing with SQLITE_BUSY mid-transaction.
+# Passing an existing connection joins the caller's transaction instead of opening a new one.
+@contextmanager
+def write_tx(conn=None):
+    if conn is not None:
+        yield conn
+        return
+    conn = get_db_connection()
+    with get_write_lock():
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
 # Function to initialize the database tables
+# Cached as a resource so the DDL runs once per server process rather than on every rerun
+@st.cache_resource
 def init_db():
     conn = get_db_connection()
     c = conn.cursor()
@@ -26,6 +101,8 @@ def init_db():
             category TEXT
         )
     ''')
+    # Covers the date range + category filter used by load_transactions
+    c.execute('CREATE INDEX IF NOT EXISTS idx_tx_date_cat ON transactions(date, category)')
     c.execute('''
         CREATE TABLE IF NOT EXISTS budgets (
             id INTEGER PRIMARY KEY,
@@ -33,80 +110,237 @@ def init_db():
             budget REAL
         )
     ''')
-    conn.commit()
-    conn.close()
+    # Persistent memo of LLM categorizations, keyed by normalized merchant text
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS category_cache (
+            merchant TEXT PRIMARY KEY,
+            category TEXT
+        )
+    ''')
+    return True
 
 # Function to add a new transaction to the database
-def add_transaction(date, description, amount, category):
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO transactions (date, description, amount, category) VALUES (?, ?, ?, ?)',
-              (date, description, amount, category))
-    conn.commit()
-    conn.close()
+def add_transaction(date, description, amount, category, conn=None):
+    with write_tx(conn) as conn:
+        conn.execute('INSERT INTO transactions (date, description, amount, category) VALUES (?, ?, ?, ?)',
+                     (date, description, amount, category))
+    clear_transaction_caches()  # Invalidate the cached queries so the new row shows up
 
-# Function to load all transactions from the database
-def load_transactions():
-    conn = get_db_connection()
-    df = pd.read_sql_query("SELECT * FROM transactions ORDER BY date DESC", conn)
-    conn.close()
-    if not df.empty:
-        df['date'] = pd.to_datetime(df['date'])
-    return df
+# Function to add many transactions at once, e.g. from an import
+# All rows go in with one executemany inside a single transaction, so the commit cost is paid once
+def add_transactions_bulk(rows):
+    with write_tx() as conn:
+        conn.executemany('INSERT INTO transactions (date, description, amount, category) VALUES (?, ?, ?, ?)',
+                         rows)
+    clear_transaction_caches()
+
+# Function to load the transactions matching the sidebar filters
+# The filtering happens in SQLite so rows outside the range are never materialized.
+# Cached so Streamlit reruns reuse the DataFrame instead of hitting SQLite each time
+@st.cache_data(ttl=60)
+def load_transactions(categories, start_date, end_date):
+    if not categories:
+        return pd.DataFrame()
+    conn = get_read_connection()
+    placeholders = ",".join("?" * len(categories))
+    query = f"SELECT * FROM transactions WHERE date BETWEEN ? AND ? AND category IN ({placeholders}) ORDER BY date DESC"
+    # Parse dates with an explicit format while materializing, instead of a second to_datetime pass
+    df = pd.read_sql_query(query, conn, params=[start_date.isoformat(), end_date.isoformat(), *categories],
+                           parse_dates={'date': {'format': '%Y-%m-%d'}})
+    return df.astype({'category': CATEGORY_DTYPE})
+
+# Function to load the distinct categories that have transactions
+@st.cache_data(ttl=60)
+def load_categories():
+    conn = get_read_connection()
+    return [row['category'] for row in conn.execute('SELECT DISTINCT category FROM transactions')]
+
+# Function to load the id and description of every transaction in a category
+def load_transactions_in_category(category):
+    conn = get_read_connection()
+    return conn.execute('SELECT id, description FROM transactions WHERE category = ?', (category,)).fetchall()
+
+# Function to update the category of many transactions in one write transaction
+def update_transaction_categories(updates):
+    with write_tx() as conn:
+        conn.executemany('UPDATE transactions SET category = ? WHERE id = ?', updates)
+    clear_transaction_caches()
+
+# Function to drop every cached result derived from the transactions table
+def clear_transaction_caches():
+    load_transactions.clear()
+    load_categories.clear()
+    compute_dashboard.clear()
 
 # Function to add or update a budget
-def add_budget(category, budget):
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT OR REPLACE INTO budgets (category, budget) VALUES (?, ?)',
-              (category, budget))
-    conn.commit()
-    conn.close()
+def add_budget(category, budget, conn=None):
+    with write_tx(conn) as conn:
+        conn.execute('INSERT OR REPLACE INTO budgets (category, budget) VALUES (?, ?)',
+                     (category, budget))
+    get_budgets()[category] = budget  # Keep the session copy in step with SQLite
 
 # Function to load all budgets
 def load_budgets():
-    conn = get_db_connection()
-    budgets_dict = pd.read_sql_query("SELECT category, budget FROM budgets", conn)
-    conn.close()
-    if not budgets_dict.empty:
-        return budgets_dict.set_index('category')['budget'].to_dict()
-    return {}
+    conn = get_read_connection()
+    return {row['category']: row['budget'] for row in conn.execute("SELECT category, budget FROM budgets")}
+
+# Function to get the budgets for this session
+# Budgets are a handful of rows, so they are read from SQLite once and kept in session state
+def get_budgets():
+    if 'budgets' not in st.session_state:
+        st.session_state['budgets'] = load_budgets()
+    return st.session_state['budgets']
+
+# Function to look up a previously stored categorization for a merchant
+def load_cached_category(merchant):
+    conn = get_read_connection()
+    row = conn.execute('SELECT category FROM category_cache WHERE merchant = ?', (merchant,)).fetchone()
+    return row['category'] if row else None
+
+# Function to store a categorization so it survives app restarts
+def save_cached_category(merchant, category, conn=None):
+    with write_tx(conn) as conn:
+        conn.execute('INSERT OR REPLACE INTO category_cache (merchant, category) VALUES (?, ?)',
+                     (merchant, category))
 
 # --- LLM Functions (AI for categorization) ---
+# Regexes used on every categorization, compiled once
+_DIGITS = re.compile(r'\d+')
+_WHITESPACE = re.compile(r'\s+')
+
+# Structured output configs: the model must answer with a JSON category from CATEGORIES
+# (or a JSON array of them), so responses are parsed with json.loads instead of cleaned up
+CATEGORY_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': {'type': 'STRING', 'enum': list(CATEGORIES)},
+}
+CATEGORY_LIST_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': {'type': 'ARRAY', 'items': {'type': 'STRING', 'enum': list(CATEGORIES)}},
+}
+
+# Function to build the Gemini model once per server process instead of per call
+@st.cache_resource
+def get_gemini_model():
+    # Configure the Google Generative AI client with the provided API key
+    genai.configure(api_key=API_KEY)
+    return genai.GenerativeModel('gemini-2.5-flash-preview-05-20')
+
+# Function to reduce a description to a stable merchant key,
+# e.g. "STARBUCKS #1234  Seattle" -> "starbucks # seattle"
+def normalize_merchant(description):
+    merchant = _DIGITS.sub('', description)
+    return _WHITESPACE.sub(' ', merchant).strip().lower()
+
+# Function to categorize a normalized merchant, memoized in memory and in SQLite
+# Errors are raised rather than returned so a failed API call is never cached
+@st.cache_data(ttl=86400, max_entries=10000, show_spinner=False)
+def categorize_merchant(merchant):
+    category = load_cached_category(merchant)
+    if category:
+        return category
+
+    # Use a single prompt to get the category; the schema restricts the answer to CATEGORIES
+    prompt = f"Categorize this transaction description.\n\nTransaction: {merchant}"
+    response = get_gemini_model().generate_content(prompt, generation_config=CATEGORY_CONFIG)
+    category = json.loads(response.text)
+    # Guard what gets persisted in case the schema is ever not honoured
+    if category not in CAT_INDEX:
+        category = "Other"
+    save_cached_category(merchant, category)
+    return category
+
+# Function to categorize many descriptions with a single Gemini request
+# Merchants already in the persistent cache are not sent; if the reply can't
+# be matched up with the request, the uncached descriptions fall back to 'Other'
+def categorize_batch(descriptions):
+    if not API_KEY:
+        st.warning("API categorization is disabled. Please create a 'secret.py' file with your API key to enable it.")
+        return ["Other"] * len(descriptions)
+
+    merchants = [normalize_merchant(description) for description in descriptions]
+    categories = {merchant: load_cached_category(merchant) for merchant in set(merchants) if merchant}
+    pending = [merchant for merchant, category in categories.items() if category is None]
+
+    if pending:
+        lines = "\n".join(f"{i}) {merchant}" for i, merchant in enumerate(pending, 1))
+        prompt = f"Categorize each of these numbered transaction descriptions, answering in the same order.\n\n{lines}"
+        try:
+            response = get_gemini_model().generate_content(prompt, generation_config=CATEGORY_LIST_CONFIG)
+            answers = json.loads(response.text)
+        except Exception as e:
+            st.error(f"Error with categorization service: {e}")
+        else:
+            # Answers are matched by position, so a short or long reply can't be trusted
+            if len(answers) != len(pending):
+                answers = []
+            with write_tx() as conn:
+                for merchant, category in zip(pending, answers):
+                    if category in CAT_INDEX:
+                        categories[merchant] = category
+                        save_cached_category(merchant, category, conn)
+
+    return [categories.get(merchant) or "Other" for merchant in merchants]
+
 # Function to automatically categorize a transaction using a language model
 def categorize_transaction(description):
-    # Import the API key from a separate, secure file
-    # Ensure a file named 'secret.py' exists in your project with the key defined
-    try:
-        from secret import API_KEY as api_key
-    except ImportError:
-        api_key = "" # Fallback if secret.py is not found
+    if not API_KEY:
         st.warning("API categorization is disabled. Please create a 'secret.py' file with your API key to enable it.")
-
-    if not api_key:
         return "Other" # Return 'Other' if no key is provided
-    
+
+    merchant = normalize_merchant(description)
+    if not merchant:
+        return "Other"
+
     try:
-        # Configure the Google Generative AI client with the provided API key
-        genai.configure(api_key=api_key)
-        
-        # Use a single prompt to get the category
-        prompt = f"Categorize the following transaction description into one of these categories: Food, Transportation, Housing, Entertainment, Bills, Other. Only respond with the category name.\n\nTransaction: {description}"
-        
-        model = genai.GenerativeModel('gemini-2.5-flash-preview-05-20')
-        response = model.generate_content(prompt)
-
-        category = response.text
-        # Remove any leading/trailing whitespace or special characters
-        category = re.sub(r'[^a-zA-Z\s]', '', category).strip()
-        # Fallback to 'Other' if the model gives an unexpected response
-        if category not in ["Food", "Transportation", "Housing", "Entertainment", "Bills", "Other"]:
-            return "Other"
-        return category
+        return categorize_merchant(merchant)
     except Exception as e:
         st.error(f"Error with categorization service: {e}")
         return "Other" # Default to 'Other' if there's an API error
 
+# --- Data processing helpers ---
+# Function to total amounts per key in plain Python
+# The dashboard frames are small, where a dict accumulation beats groupby's fixed overhead
+def sum_by(keys, amounts):
+    totals = defaultdict(float)
+    for key, amount in zip(keys, amounts):
+        totals[key] += amount
+    return totals
+
+# Function to compute the dashboard tables for a set of filters
+# Cached on the filter values (plus budgets and today's date, which the tables depend on)
+# so reruns with unchanged filters skip the aggregation; writes clear it with the queries
+@st.cache_data(ttl=60)
+def compute_dashboard(categories, start_date, end_date, budgets, today):
+    transactions_df = load_transactions(categories, start_date, end_date)
+
+    # Derive the month once and group on it directly, without adding string columns
+    months = transactions_df['date'].dt.to_period('M')
+    current_month = pd.Period(today, 'M')
+
+    # Spending by category
+    this_month_df = transactions_df[months == current_month]
+    category_totals = sum_by(this_month_df['category'].to_numpy(), this_month_df['amount'].to_numpy())
+    spending_by_category = pd.Series(category_totals, dtype=float).rename_axis('category').reset_index(name='amount')
+
+    # Monthly spending over time
+    monthly_totals = sum_by(months.to_numpy(), transactions_df['amount'].to_numpy())
+    sorted_months = sorted(monthly_totals)
+    monthly_spending = pd.DataFrame({
+        'month': [month.to_timestamp() for month in sorted_months],
+        'amount': [monthly_totals[month] for month in sorted_months],
+    })
+
+    # Join budgets against this month's spending in one merge instead of filtering per category
+    budget_df = pd.DataFrame(list(budgets.items()), columns=['Category', 'Budget'])
+    budget_df = budget_df.merge(
+        spending_by_category.rename(columns={'category': 'Category', 'amount': 'Actual Spending'}),
+        how='left', on='Category'
+    ).fillna({'Actual Spending': 0})
+    budget_df['Remaining'] = budget_df['Budget'] - budget_df['Actual Spending']
+
+    return spending_by_category, monthly_spending, budget_df
+
 # --- Main app layout ---
 st.set_page_config(layout="wide", page_title="Personal Finance Tracker")
 
@@ -123,118 +357,100 @@ with st.sidebar:
         description = st.text_input("Description")
         amount = st.number_input("Amount", min_value=0.01, format="%.2f")
 
-        # Automatically predict category if description is provided
-        predicted_category = "Other"
-        if description:
-             predicted_category = categorize_transaction(description)
-        
-        st.info(f"Predicted category: **{predicted_category}**")
-
-        category = st.selectbox("Category", ["Food", "Transportation", "Housing", "Entertainment", "Bills", "Other"], index=["Food", "Transportation", "Housing", "Entertainment", "Bills", "Other"].index(predicted_category))
+        # Leave the category on auto-detect to have it predicted on submit. The form body
+        # re-executes on every rerun, so the LLM call must not happen here.
+        category = st.selectbox("Category", ("Auto-detect", *CATEGORIES))
         
         submitted = st.form_submit_button("Add Transaction")
         if submitted:
+            if category == "Auto-detect":
+                category = categorize_transaction(description) if description else "Other"
             add_transaction(date, description, amount, category)
-            st.success("Transaction added successfully!")
+            st.success(f"Transaction added successfully under **{category}**!")
+
+    # Re-run categorization for everything filed under 'Other' in one LLM request
+    if st.button("Re-categorize 'Other' transactions"):
+        rows = load_transactions_in_category("Other")
+        categories = categorize_batch([row['description'] for row in rows])
+        updates = [(category, row['id']) for row, category in zip(rows, categories) if category != "Other"]
+        if updates:
+            update_transaction_categories(updates)
+        st.success(f"Re-categorized {len(updates)} of {len(rows)} transactions.")
 
     st.header("Set Monthly Budgets")
     with st.form("budget_form", clear_on_submit=True):
-        budget_category = st.selectbox("Category", ["Food", "Transportation", "Housing", "Entertainment", "Bills", "Other"])
+        budget_category = st.selectbox("Category", CATEGORIES)
         budget_amount = st.number_input("Monthly Budget", min_value=0.0, format="%.2f")
         submitted_budget = st.form_submit_button("Set Budget")
         if submitted_budget:
             add_budget(budget_category, budget_amount)
             st.success(f"Monthly budget for {budget_category} set to ${budget_amount:,.2f}.")
-    
-    st.header("Filter Transactions")
-    all_transactions_df = load_transactions()
-    
-    with st.expander("Show Filters", expanded=True):
-        # Create a list of all unique categories for the filter
-        all_categories = list(all_transactions_df['category'].unique()) if not all_transactions_df.empty else ["Food", "Transportation", "Housing", "Entertainment", "Bills", "Other"]
-        selected_categories = st.multiselect("Filter by Category", all_categories, default=all_categories)
-        
-        min_date = st.date_input("Start Date", value=datetime.date(2023, 1, 1), key='start_date')
-        max_date = st.date_input("End Date", value=datetime.date.today(), key='end_date')
 
 # --- Main content area with tabs ---
 st.header("Personal Finance Dashboard")
 
-# Filter the transactions based on the user's selections
-if not all_transactions_df.empty:
-    transactions_df = all_transactions_df[
-        (all_transactions_df['category'].isin(selected_categories)) &
-        (all_transactions_df['date'].dt.date >= min_date) &
-        (all_transactions_df['date'].dt.date <= max_date)
-    ]
-else:
-    transactions_df = pd.DataFrame()
+# Filters and dashboard render as a fragment: changing a filter reruns only this block,
+# not the sidebar forms. Fragments cannot write to the sidebar, so the filters live here.
+@st.fragment
+def render_dashboard():
+    with st.expander("Filter Transactions", expanded=True):
+        # Create a list of all unique categories for the filter
+        all_categories = load_categories() or list(CATEGORIES)
+        selected_categories = st.multiselect("Filter by Category", all_categories, default=all_categories)
+    
+        min_date = st.date_input("Start Date", value=datetime.date(2023, 1, 1), key='start_date')
+        max_date = st.date_input("End Date", value=datetime.date.today(), key='end_date')
 
+    # Load only the transactions matching the user's selections
+    transactions_df = load_transactions(tuple(selected_categories), min_date, max_date)
 
-tab1, tab2 = st.tabs(["📊 Dashboard", "📜 Transaction History"])
+    tab1, tab2 = st.tabs(["📊 Dashboard", "📜 Transaction History"])
 
-with tab1:
-    budgets = load_budgets()
+    with tab1:
+        budgets = get_budgets()
 
-    if not transactions_df.empty:
-        # Data processing for charts and tips
-        transactions_df['month'] = transactions_df['date'].dt.to_period('M')
-        transactions_df['month_str'] = transactions_df['date'].dt.strftime("%Y-%m")
-        current_month_str = datetime.date.today().strftime("%Y-%m")
-        
-        # Spending by category
-        spending_by_category = transactions_df[transactions_df['month_str'] == current_month_str].groupby('category')['amount'].sum().reset_index()
+        if not transactions_df.empty:
+            spending_by_category, monthly_spending, budget_df = compute_dashboard(
+                tuple(selected_categories), min_date, max_date, budgets, datetime.date.today()
+            )
 
-        # Monthly spending over time
-        monthly_spending = transactions_df.groupby('month_str')['amount'].sum().reset_index()
-        monthly_spending['month_str'] = pd.to_datetime(monthly_spending['month_str']).dt.date
-        
-        # Display charts in columns for a better layout
-        col1, col2 = st.columns(2)
-        with col1:
-            st.subheader("Spending by Category (This Month)")
-            st.bar_chart(spending_by_category, x='category', y='amount')
+            # Display charts in columns for a better layout
+            col1, col2 = st.columns(2)
+            with col1:
+                st.subheader("Spending by Category (This Month)")
+                st.bar_chart(spending_by_category, x='category', y='amount')
             
-        with col2:
-            st.subheader("Monthly Spending Over Time")
-            st.line_chart(monthly_spending, x='month_str', y='amount')
+            with col2:
+                st.subheader("Monthly Spending Over Time")
+                st.line_chart(monthly_spending, x='month', y='amount')
 
-        # Budget vs Actual Spending
-        st.subheader("Budget vs. Actual Spending (This Month)")
+            # Budget vs Actual Spending
+            st.subheader("Budget vs. Actual Spending (This Month)")
         
-        budget_comparison = []
-        for category, budget in budgets.items():
-            actual_spending = spending_by_category[spending_by_category['category'] == category]['amount'].sum()
-            remaining = budget - actual_spending
-            budget_comparison.append({
-                'Category': category,
-                'Budget': budget,
-                'Actual Spending': actual_spending,
-                'Remaining': remaining
-            })
-        
-        budget_df = pd.DataFrame(budget_comparison)
-        if not budget_df.empty:
-            st.dataframe(budget_df, use_container_width=True)
-        else:
-            st.info("No budgets have been set yet.")
+            if not budget_df.empty:
+                st.dataframe(budget_df, use_container_width=True)
+            else:
+                st.info("No budgets have been set yet.")
             
-        # Financial Tips section
-        st.subheader("Financial Tips")
+            # Financial Tips section
+            st.subheader("Financial Tips")
         
-        over_budget_categories = [row['Category'] for index, row in budget_df.iterrows() if row['Remaining'] < 0]
-        if over_budget_categories:
-            st.warning(f"🚨 **Warning:** You are over budget in the following categories: {', '.join(over_budget_categories)}. Consider cutting back on non-essential spending.")
+            over_budget_categories = budget_df.loc[budget_df['Remaining'] < 0, 'Category'].tolist()
+            if over_budget_categories:
+                st.warning(f"🚨 **Warning:** You are over budget in the following categories: {', '.join(over_budget_categories)}. Consider cutting back on non-essential spending.")
+            else:
+                st.success("🎉 **Great job!** You are on track with your spending this month.")
         else:
-            st.success("🎉 **Great job!** You are on track with your spending this month.")
-    else:
-        st.info("No transactions found. Use the sidebar to get started.")
-
-with tab2:
-    st.subheader("Transaction History")
-    # Use an expander to make the transaction history collapsible
-    with st.expander("View filtered transactions", expanded=True):
-        if not transactions_df.empty:
-            st.dataframe(transactions_df, use_container_width=True)
-        else:
-            st.info("No transactions to display based on your filters.")
+            st.info("No transactions found. Use the sidebar to get started.")
+
+    with tab2:
+        st.subheader("Transaction History")
+        # Use an expander to make the transaction history collapsible
+        with st.expander("View filtered transactions", expanded=True):
+            if not transactions_df.empty:
+                st.dataframe(transactions_df, use_container_width=True)
+            else:
+                st.info("No transactions to display based on your filters.")
+
+
+render_dashboard()